@@ -2,5 +2,10 @@ __version__ = "0.2.2"
 __license__ = "MIT"
 
 from .debug import Debug
-from .myers import (Coord, Deletes, Diff, Inserts, Matches, MyersBase,
-                    MyersRealTime, MyersTree)
+from .hierarchical import HierarchicalDiff, MyersBounded, MyersHierarchical
+from .multi import MyersMultiRealTime
+from .myers import (AdaptiveTruncatePolicy, Coord, Deletes, Diff, Inserts,
+                    Matches, MyersBase, MyersDuplex, MyersIncremental,
+                    MyersRealTime, MyersTree, TruncatePolicy)
+from .parallel import MyersParallel
+from .vectorize import MyersNumpy
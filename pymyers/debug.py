@@ -4,7 +4,7 @@ import shutil
 import turtle
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Sequence, Union
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
 
 @dataclass
@@ -85,15 +85,24 @@ class Debug:
             self._pen4()
             self._draw_line(start, end)
 
-    def update(self, b):
+    def update(self, b, a=None):
+        if a is not None:
+            self._write(a, "a{}.pickle".format(self._update_num))
         self._write(b, "b{}.pickle".format(self._update_num))
         self._update_num += 1
-        self.b = self.b + b
-        self.prev_m = self.m
-        self.m = len(self.b)
-        if self.plot:
+        if self.plot:  # a and b are only kept for drawing
+            if a is not None:
+                self.a = self.a + a
+                self.n = len(self.a)
+            self.b = self.b + b
+            self.prev_m = self.m
+            self.m = len(self.b)
             turtle.tracer(False)
-            self._update_background()
+            if a:  # grid grows rightward, redraw all
+                self._clear()
+                self._draw_background()
+            else:
+                self._update_background()
             turtle.tracer(self.animation)
 
         if self.forward_color == "red":
@@ -103,13 +112,24 @@ class Debug:
         elif self.forward_color == "green":
             self.forward_color = "red"
 
+    def revise(self, k, b):
+        self._write(k, "r{}.pickle".format(self._update_num))
+        if self.plot:
+            self.b = self.b[: max(len(self.b) - k, 0)]
+            self.m = len(self.b)
+            self._clear()
+            turtle.tracer(False)
+            self._draw_background()
+            turtle.tracer(self.animation)
+        self.update(b)
+
     def done(self):
         if self.plot:
             turtle.done()
 
     @staticmethod
     def read(folder: Union[str, Path]) -> List[Sequence]:
-        """read from myers log folder
+        """read from myers log folder, elements retracted by revise are removed from b
 
         Args:
             folder (_type_): foler with head log-myers-
@@ -126,6 +146,10 @@ class Debug:
         while True:
             b_file = Path(folder) / "b{}.pickle".format(i)
             if b_file.exists():
+                r_file = Path(folder) / "r{}.pickle".format(i)
+                if r_file.exists():
+                    with open(r_file, "rb") as f:
+                        Debug._retract(tmp, pickle.load(f))
                 with open(b_file, "rb") as f:
                     tmp.append(pickle.load(f))
                 i += 1
@@ -133,6 +157,37 @@ class Debug:
                 break
         return tmp
 
+    @staticmethod
+    def read_duplex(folder: Union[str, Path]) -> List[Tuple[Sequence, Sequence]]:
+        """read from myers log folder of MyersDuplex, elements retracted by revise are removed from b
+
+        Args:
+            folder (_type_): foler with head log-myers-
+
+        Returns:
+            List[Tuple[Sequence, Sequence]]: list in order [(a0, b0), (a1, b1), ...], a chunk is empty if a didn't grow
+        """
+        a0, *b = Debug.read(folder)
+        a = [a0]
+        for i in range(1, len(b)):
+            a_file = Path(folder) / "a{}.pickle".format(i)
+            if a_file.exists():
+                with open(a_file, "rb") as f:
+                    a.append(pickle.load(f))
+            else:
+                a.append(a0[:0])
+        return list(zip(a, b))
+
+    @staticmethod
+    def _retract(chunks: List[Sequence], k: int):
+        # remove the trailing k elements of b chunks, chunks[0] is a
+        i = len(chunks) - 1
+        while k > 0 and i > 0:
+            cut = min(k, len(chunks[i]))
+            chunks[i] = chunks[i][: len(chunks[i]) - cut]
+            k -= cut
+            i -= 1
+
     def _clear(self):
         if self.plot:
             turtle.clearscreen()
@@ -0,0 +1,145 @@
+from collections import namedtuple
+from typing import (Any, Callable, Dict, Hashable, Optional, Sequence, Tuple,
+                    Type)
+
+from pymyers.debug import Coord
+from pymyers.myers import Diff, Matches, MyersBase
+
+# lines: Diff of lines, pairs: list of (a_line, b_line) paired in changed hunks,
+# tokens: Diff of tokens of each pair, None if the pair exceeds max_d
+HierarchicalDiff = namedtuple("HierarchicalDiff", ["lines", "pairs", "tokens"])
+
+
+class MyersBounded(MyersBase):
+    def __init__(
+        self,
+        a: Sequence,
+        b: Sequence,
+        eq: Optional[Callable[[Any, Any], bool]] = None,
+        max_d: Optional[int] = None,
+    ):
+        """myerse giving up once the edit distance exceeds max_d
+
+        Args:
+            a (Sequence): a reference str/list/...
+            b (Sequence): str/list/... that is expected to be compared with a
+            eq (Optional[Callable[[Any, Any], bool]]): eq fn which should resolve a==b. Defaults to None.
+            max_d (Optional[int], optional): max edit distance searched. Defaults to None, unbounded.
+        """
+        super().__init__(a, b, eq)
+        self.max_d = max_d
+
+    def max_edit(self, n: int, m: int) -> int:
+        return min(n + m, self.max_d) if self.max_d is not None else n + m
+
+    def diff(self) -> Optional[Diff]:  # type: ignore [override]
+        """calculate diff between a, b
+
+        Returns:
+            Optional[Diff]: namedtuple('Diff', ['matches', 'deletes', 'inserts']), None if the edit distance exceeds max_d
+        """
+        forward_trace = self.shortest_edit()
+        if forward_trace is None:
+            return None
+        return self.resolve_trace(self.backtrace(forward_trace))
+
+
+class MyersHierarchical:
+    def __init__(
+        self,
+        a: Sequence[Sequence],
+        b: Sequence[Sequence],
+        eq: Optional[Callable[[Any, Any], bool]] = None,
+        engine: Type[MyersBase] = MyersBase,
+        max_d: Optional[int] = 50,
+        cache: Optional[Dict[Tuple, Optional[Diff]]] = None,
+        cache_size: int = 4096,
+    ):
+        """two-level myerse, lines are diffed first, then deleted and inserted lines of each changed hunk
+        are paired in order and their tokens are diffed
+
+        Args:
+            a (Sequence[Sequence]): a reference list of lines, each line is a str/list/... of tokens
+            b (Sequence[Sequence]): list of lines that is expected to be compared with a
+            eq (Optional[Callable[[Any, Any], bool]]): eq fn which should resolve token_a==token_b. Defaults to None.
+            engine (Type[MyersBase], optional): myers class diffing lines, e.g. MyersNumpy. Defaults to MyersBase.
+            max_d (Optional[int], optional): max edit distance of tokens of a pair, pairs beyond it are not diffed,
+                                             None for unbounded. Defaults to 50.
+            cache (Optional[Dict], optional): memo of token diffs keyed by (a_line, b_line, max_d, eq), can be shared by
+                                              instances. Defaults to None, a new cache.
+            cache_size (int, optional): max entries of cache, oldest entries are dropped first. Defaults to 4096.
+        """
+        self.a = a
+        self.b = b
+        self.eq = eq
+        self.engine = engine
+        self.max_d = max_d
+        self.cache = cache if cache is not None else {}
+        self.cache_size = cache_size
+
+    def diff(self) -> HierarchicalDiff:
+        """calculate diff between lines of a, b and tokens of paired lines
+
+        Returns:
+            HierarchicalDiff: namedtuple('HierarchicalDiff', ['lines', 'pairs', 'tokens']), corresponding to diff of lines,
+                              list of (a_line, b_line) and diff of tokens of each pair respectively
+        """
+        if not len(self.a) and not len(self.b):
+            return HierarchicalDiff(Diff([], [], []), [], [])
+        lines = self.engine(self.a, self.b).diff()
+        pairs = self.pair(lines, len(self.a), len(self.b))
+        tokens = [self.token_diff(self.a[c.x], self.b[c.y]) for c in pairs]
+        return HierarchicalDiff(lines, pairs, tokens)
+
+    @staticmethod
+    def pair(lines: Diff, n: int, m: int) -> Matches:
+        """pair deleted and inserted lines between the same two matches in order
+
+        Args:
+            lines (Diff): diff of lines
+            n (int): number of lines of a
+            m (int): number of lines of b
+
+        Returns:
+            Matches: list of (a_line, b_line)
+        """
+        pairs: Matches = []
+        i = j = 0
+        for end in list(lines.matches) + [Coord(n, m)]:
+            start_i, start_j = i, j
+            while i < len(lines.deletes) and lines.deletes[i] < end.x:
+                i += 1
+            while j < len(lines.inserts) and lines.inserts[j] < end.y:
+                j += 1
+            pairs += [Coord(x, y) for x, y in zip(lines.deletes[start_i:i], lines.inserts[start_j:j])]
+        return pairs
+
+    def token_diff(self, line_a: Sequence, line_b: Sequence) -> Optional[Diff]:
+        """diff tokens of two lines, served from cache if diffed before
+
+        Args:
+            line_a (Sequence): line of a
+            line_b (Sequence): line of b
+
+        Returns:
+            Optional[Diff]: diff of tokens, None if the edit distance exceeds max_d
+        """
+        # token lists are keyed as tuples, diffs depend on max_d and eq too
+        key = (_hashable(line_a), _hashable(line_b), self.max_d, self.eq)
+        try:
+            return self.cache[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable lines
+            return MyersBounded(line_a, line_b, self.eq, self.max_d).diff()
+
+        diff = MyersBounded(line_a, line_b, self.eq, self.max_d).diff()
+        if self.cache_size > 0:
+            while len(self.cache) >= self.cache_size:
+                del self.cache[next(iter(self.cache))]
+            self.cache[key] = diff
+        return diff
+
+
+def _hashable(line: Sequence) -> Sequence:
+    return line if isinstance(line, Hashable) else tuple(line)
@@ -0,0 +1,190 @@
+from typing import (Any, Callable, Dict, Hashable, List, Mapping, Optional,
+                    Sequence, Tuple, Union)
+
+from pymyers.debug import Coord
+from pymyers.myers import Diff, MyersRealTime, TruncatePolicy
+
+
+class _Buffer:
+    def __init__(self, b: Sequence):
+        """b shared by all candidates, elements before offset are dropped once no candidate needs them
+
+        Args:
+            b (Sequence): initial b
+        """
+        self.data: List = list(b)
+        self.offset = 0  # index of data[0] in b
+
+    def __len__(self) -> int:
+        return self.offset + len(self.data)
+
+    def extend(self, b: Sequence) -> None:
+        self.data.extend(b)
+
+    def compact(self, start: int) -> None:
+        """drop elements before start, only done when they are at least half of data to stay amortized O(1)
+
+        Args:
+            start (int): min index of b still needed
+        """
+        drop = start - self.offset
+        if drop > len(self.data) // 2:
+            del self.data[:drop]
+            self.offset = start
+
+
+class _BufferView(Sequence):
+    def __init__(self, buffer: _Buffer, start: int, stop: int):
+        """b[start:stop] of the shared buffer without copying, suffix slices are views too
+
+        Args:
+            buffer (_Buffer): shared buffer
+            start (int): index of the first element in b
+            stop (int): index after the last element in b
+        """
+        self.buffer = buffer
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            r = range(self.start, self.stop)[i]
+            if r.step == 1 and r.stop == self.stop:  # b[y:], e.g. truncated b
+                return _BufferView(self.buffer, r.start, r.stop)
+            return [self.buffer.data[j - self.buffer.offset] for j in r]
+        if not 0 <= i < self.stop - self.start:
+            i = range(self.stop - self.start)[i]  # negative index, or raise IndexError
+        return self.buffer.data[self.start + i - self.buffer.offset]
+
+    def __add__(self, other: Sequence) -> List:
+        return list(self) + list(other)
+
+
+class _MyersCandidate(MyersRealTime):
+    # b is a view of the shared buffer, new b has already been appended to the buffer
+    def extend(self, b: Sequence) -> Sequence:
+        return _BufferView(self.b.buffer, self.b.start, self.b.stop + len(b))  # type: ignore [attr-defined]
+
+
+class MyersMultiRealTime:
+    def __init__(
+        self,
+        references: Union[Sequence[Sequence], Mapping[Hashable, Sequence]],
+        b: Sequence,
+        eq: Optional[Callable[[Any, Any], bool]] = None,
+        beam: Optional[int] = 10,
+        max_depth: int = 50,
+        truncate_depth: Optional[int] = None,
+        policy: Optional[Callable[[], TruncatePolicy]] = None,
+    ):
+        """realtime myerse aligning one b against several candidate references,
+        candidates whose edit cost exceeds the best one by more than beam are dropped
+
+        Args:
+            references (Union[Sequence[Sequence], Mapping[Hashable, Sequence]]): candidate a, keyed by index for a list
+            b (Sequence): str/list/... that is expected to be compared with references, b can be empty.
+            eq (Optional[Callable[[Any, Any], bool]]): eq fn which should resolve a==b, disables interning. Defaults to None.
+            beam (Optional[int], optional): max extra cost of a candidate over the best one. Defaults to 10, None for no pruning.
+            max_depth (int): max depth of trace, see MyersRealTime
+            truncate_depth (int): min depth backtraced from end_node after trace exceeds max_depth, see MyersRealTime
+            policy (Optional[Callable[[], TruncatePolicy]]): factory of truncate policy of each candidate. Defaults to None.
+        """
+        if not isinstance(references, Mapping):
+            references = dict(enumerate(references))
+        if not references:
+            raise ValueError("at least one reference is required")
+        self.eq = eq
+        self.beam = beam
+
+        # elements are interned to int ids shared by all candidates, elements not in any reference never match
+        self.table: Optional[Dict[Any, int]] = None
+        if eq is None:
+            try:
+                table: Dict[Any, int] = {}
+                references = {key: [table.setdefault(e, len(table)) for e in a] for key, a in references.items()}
+                self.table = table
+            except TypeError:  # unhashable elements
+                pass
+        # interned once, shared by all candidates
+        self.buffer = _Buffer(self.intern(b))
+
+        self.candidates: Dict[Hashable, MyersRealTime] = {
+            key: _MyersCandidate(
+                a,
+                _BufferView(self.buffer, 0, len(self.buffer)),
+                eq=eq,
+                max_depth=max_depth,
+                truncate_depth=truncate_depth,
+                policy=policy() if policy else None,
+            )
+            for key, a in references.items()
+        }
+        self.pruned: List[Hashable] = []
+        # whole diff of each candidate so far, the increments of MyersRealTime.update merged in place
+        self.diffs: Dict[Hashable, Diff] = {key: Diff([], [], []) for key in self.candidates}
+        self.best: Hashable = next(iter(self.candidates))
+
+    def intern(self, b: Sequence) -> Sequence:
+        """map elements of b to ids of references
+
+        Args:
+            b (Sequence): str/list/...
+
+        Returns:
+            Sequence: list of ids, or b itself when interning is disabled
+        """
+        if self.table is None:
+            return b
+        return [self.table.get(e, -1) for e in b]
+
+    @property
+    def costs(self) -> Dict[Hashable, int]:
+        return {key: myers.cost for key, myers in self.candidates.items()}
+
+    def update(self, b: Sequence) -> Tuple[Hashable, Diff]:
+        """add new b to all candidates and get the best one
+
+        Args:
+            b (Sequence): b to be appended to current b
+
+        Returns:
+            Tuple[Hashable, Diff]: key of the best reference, and its whole diff against b so far, usable when the best
+                                   reference changes. The diff is updated in place by later updates, its tail may be
+                                   revised by them as MyersRealTime.update
+        """
+        if not len(b):  # nothing to search, truncating now would leave costs without the unsettled trace
+            return self.best, self.diffs[self.best]
+        b = self.intern(b)  # interned once, shared by all candidates
+        self.buffer.extend(b)
+        for key, myers in self.candidates.items():
+            _merge(self.diffs[key], myers.update(b), myers.latest_trace[0])
+        self.prune()
+        self.buffer.compact(min(myers.b.start for myers in self.candidates.values()))  # type: ignore [attr-defined]
+        return self.best, self.diffs[self.best]
+
+    def prune(self) -> None:
+        costs = self.costs
+        self.best = min(costs, key=costs.__getitem__)
+        if self.beam is None:
+            return
+        for key, cost in costs.items():
+            if cost > costs[self.best] + self.beam:
+                del self.candidates[key]
+                del self.diffs[key]
+                self.pruned.append(key)
+
+
+def _merge(total: Diff, diff: Diff, fork: Coord) -> None:
+    # steps of total from fork on are replaced by diff, popped steps were appended before so it's amortized O(len(diff))
+    while total.matches and total.matches[-1].x >= fork.x:
+        total.matches.pop()
+    while total.deletes and total.deletes[-1] >= fork.x:
+        total.deletes.pop()
+    while total.inserts and total.inserts[-1] >= fork.y:
+        total.inserts.pop()
+    total.matches.extend(diff.matches)
+    total.deletes.extend(diff.deletes)
+    total.inserts.extend(diff.inserts)
@@ -1,6 +1,8 @@
+import bisect
+import time
 from collections import namedtuple
 from dataclasses import dataclass
-from typing import Any, Callable, List, Optional, Sequence
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 from pymyers.debug import Coord, Debug
 
@@ -41,10 +43,22 @@ class MyersBase:
         self.log_path = log_path
         self.debug = Debug(a, b, eq=self.eq, plot=plot, animation=animation, plot_size=plot_size, log_path=log_path)
 
+    def max_edit(self, n: int, m: int) -> int:
+        """upper bound of the edit distance searched by shortest_edit, which returns None beyond it
+
+        Args:
+            n (int): length of a
+            m (int): length of b
+
+        Returns:
+            int: max edit distance, n + m searches the whole edit graph
+        """
+        return n + m
+
     def shortest_edit(self) -> List[List[int]]:  # type: ignore [return]
         n, m = len(self.a), len(self.b)
-        maxd = n + m
-        v = [0] * (maxd * 2 + 1)  # store x value indexed by k
+        maxd = self.max_edit(n, m)
+        v = [0] * (maxd * 2 + 3)  # store x value indexed by k, k in [-maxd - 1, maxd + 1]
         trace = []
         for d in range(maxd + 1):  # maxd included
             trace.append(v.copy())
@@ -128,6 +142,137 @@ class MyersBase:
         return self.resolve_trace(backward_trace)
 
 
+class MyersIncremental(MyersBase):
+    def __init__(
+        self,
+        a: Sequence,
+        b: Sequence,
+        eq: Optional[Callable[[Any, Any], bool]] = None,
+        plot: bool = False,
+        animation: bool = False,
+        plot_size: int = 50,
+        log_path: str = "",
+    ):
+        """myerse with incremental re-diff support after localized edits on a or b
+
+        Args:
+            a (Sequence): a reference str/list/...
+            b (Sequence): str/list/... that is expected to be compared with a
+            eq (Optional[Callable[[Any, Any], bool]]): eq fn which should resolve a==b. Defaults to None.
+            plot (bool, optional): whether plot debug figure. Defaults to False.
+            animation (bool, optional): draw debug figure slowly or instantly. Defaults to True.
+            plot_size (int, optional): debug figure size. Defaults to 50.
+            log_path (str, optional): log_path to save a, b. Defaults to '', no data will be saved.
+        """
+        super().__init__(a, b, eq, plot, animation, plot_size, log_path)
+        # current diff kept as int lists, matches split into a_coords and b_coords
+        self._xs: Optional[List[int]] = None
+        self._ys: List[int] = []
+        self._deletes: Deletes = []
+        self._inserts: Inserts = []
+        self._diff: Optional[Diff] = None
+
+    @property
+    def last_diff(self) -> Optional[Diff]:
+        """diff between current a, b, None if no diff has been calculated"""
+        if self._diff is None and self._xs is not None:
+            matches = [Coord(x, y) for x, y in zip(self._xs, self._ys)]
+            self._diff = Diff(matches, self._deletes[:], self._inserts[:])
+        return self._diff
+
+    def diff(self) -> Diff:
+        """calculate diff between a, b
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), corresponding to indexes of (a, b), indexes of a, indexes of b respectively
+        """
+        diff = super().diff()
+        self._load(diff)
+        return diff
+
+    def _load(self, diff: Diff) -> None:
+        self._xs = [x for x, _ in diff.matches]
+        self._ys = [y for _, y in diff.matches]
+        self._deletes = list(diff.deletes)
+        self._inserts = list(diff.inserts)
+        self._diff = diff
+
+    def replace(
+        self, start: int, stop: int, seq: Sequence, side: str = "a", prev: Optional[Diff] = None, margin: int = 0
+    ) -> Diff:
+        """replace a[start:stop] (or b[start:stop]) with seq and re-diff,
+        matches before and after the edit are reused, myers only runs on the window between them,
+        the full diff after the edit is available as last_diff
+
+        Args:
+            start (int): start index of the replaced range
+            stop (int): stop index of the replaced range, exclusive
+            seq (Sequence): elements replacing the range
+            side (str, optional): "a" or "b", the edited sequence. Defaults to "a".
+            prev (Optional[Diff], optional): diff between a and b before the edit. Defaults to None, the last calculated diff,
+                                             if no diff has been calculated, a full diff is run after the edit.
+            margin (int, optional): number of matches next to the edit on each side that are re-diffed too,
+                                    a bigger margin gives diffs closer to a full diff. Defaults to 0.
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), diffs of the re-diffed window, in indexes of the edited a, b
+        """
+        if side not in ("a", "b"):
+            raise ValueError("side should be 'a' or 'b', got {!r}".format(side))
+        if not 0 <= start <= stop <= len(self.a if side == "a" else self.b):
+            raise ValueError("invalid range [{}, {}) of {}".format(start, stop, side))
+        if prev is not None:
+            self._load(prev)
+
+        n, m = len(self.a), len(self.b)  # lengths before the edit
+        if side == "a":
+            self.a = self.a[:start] + seq + self.a[stop:]  # type: ignore [operator]
+        else:
+            self.b = self.b[:start] + seq + self.b[stop:]  # type: ignore [operator]
+        if self._xs is None:
+            return self.diff()
+
+        delta = len(seq) - (stop - start)
+        xs, ys = self._xs, self._ys
+        edited = xs if side == "a" else ys
+        i = max(bisect.bisect_left(edited, start) - margin, 0)
+        j = min(bisect.bisect_left(edited, stop) + margin, len(edited))
+        # window bounded by the nearest matches before and after the edit, in coords before the edit
+        lo = Coord(xs[i - 1] + 1, ys[i - 1] + 1) if i else Coord(0, 0)
+        hi = Coord(xs[j], ys[j]) if j < len(xs) else Coord(n, m)
+        shift = Coord(delta, 0) if side == "a" else Coord(0, delta)
+
+        window_a, window_b = self.a[lo.x : hi.x + shift.x], self.b[lo.y : hi.y + shift.y]
+        window = Diff([], [], [])
+        if len(window_a) or len(window_b):
+            window = MyersBase(window_a, window_b, eq=self.eq).diff()
+        window = Diff(
+            [c + lo for c in window.matches],
+            [x + lo.x for x in window.deletes],
+            [y + lo.y for y in window.inserts],
+        )
+
+        # splice the window in, only indexes after the window on the edited side are shifted
+        _splice(xs, i, j, [c.x for c in window.matches], shift.x)
+        _splice(ys, i, j, [c.y for c in window.matches], shift.y)
+        deletes, inserts = self._deletes, self._inserts
+        _splice(
+            deletes, bisect.bisect_left(deletes, lo.x), bisect.bisect_left(deletes, hi.x), window.deletes, shift.x
+        )
+        _splice(
+            inserts, bisect.bisect_left(inserts, lo.y), bisect.bisect_left(inserts, hi.y), window.inserts, shift.y
+        )
+        self._diff = None
+        return window
+
+
+def _splice(values: List[int], i: int, j: int, window: List[int], shift: int) -> None:
+    # replace values[i:j] by window and shift values after it
+    if shift:
+        values[j:] = [v + shift for v in values[j:]]
+    values[i:j] = window
+
+
 @dataclass
 class TreeNode:
     x: int
@@ -145,25 +290,26 @@ class TreeNode:
     down_ch: Optional["TreeNode"] = None  # downward child
     diag_ch: Optional["TreeNode"] = None  # diagonal child
     p: Optional["TreeNode"] = None  # parent
+    edits: int = 0  # deletes and inserts on the path from root
 
     def downward(self) -> "TreeNode":
         if self.down_ch:
             return self.down_ch
-        node = TreeNode(self.x, self.y + 1, p=self)
+        node = TreeNode(self.x, self.y + 1, p=self, edits=self.edits + 1)
         self.down_ch = node
         return node
 
     def rightward(self) -> "TreeNode":
         if self.right_ch:
             return self.right_ch
-        node = TreeNode(self.x + 1, self.y, p=self)
+        node = TreeNode(self.x + 1, self.y, p=self, edits=self.edits + 1)
         self.right_ch = node
         return node
 
     def diagonal(self) -> "TreeNode":
         if self.diag_ch:
             return self.diag_ch
-        node = TreeNode(self.x + 1, self.y + 1, p=self)
+        node = TreeNode(self.x + 1, self.y + 1, p=self, edits=self.edits)
         self.diag_ch = node
         return node
 
@@ -187,6 +333,7 @@ class Tree:
 
         self._leaves: List[TreeNode] = [None] * leave_size # nodes indexed by k
         self._leaves[1] = self.root  # set virtual root
+        self._history: List[Tuple[int, int, List[TreeNode]]] = []  # snapshots of (m, d, leaves)
         self.commit()
 
         self._trace: List[TreeNode] = [self.root]
@@ -225,8 +372,9 @@ class Tree:
         except ValueError:
             return False
 
-    def commit(self):
+    def commit(self, m: int = 0, d: int = 0):
         self._leaves_backup = self._leaves[:]
+        self._history.append((m, d, self._leaves_backup))
         self._commited = True
 
     def checkout(self):
@@ -234,11 +382,32 @@ class Tree:
         self.farest_node = self.root
         self._commited = False
 
+    def rollback(self, m: int) -> int:
+        """drop snapshots and trace that depend on b[m:], restore the latest remaining snapshot
+
+        Args:
+            m (int): length of b that is kept
+
+        Returns:
+            int: depth of the restored snapshot, search should be resumed from it
+        """
+        while self._history[-1][0] > m:  # the initial snapshot has m == 0, never dropped
+            self._history.pop()
+        _, d, self._leaves_backup = self._history[-1]
+        self._trace = [n for n in self._trace if n.y <= m]
+        self._latest_trace = []
+        self._tmp_trace = []
+        self.end_node = self._trace[-1]
+        return d
+
     @property
     def commited(self):
         return self._commited
 
     def truncate(self, depth: int) -> Coord:
+        return self.truncate_node(depth).coord
+
+    def truncate_node(self, depth: int) -> TreeNode:
         node = self.end_node
         d = 0
         while node.p:
@@ -251,7 +420,11 @@ class Tree:
 
         if node == self.root:
             node = self.root.down_ch  # type: ignore [assignment]
-        return node.coord
+        return node
+
+    def depth(self, node: TreeNode) -> int:
+        """number of deletes and inserts on the path from root to node"""
+        return max(node.edits - 1, 0)  # edge from virtual root excluded
 
 
 class MyersTree(MyersBase):
@@ -323,6 +496,85 @@ class MyersTree(MyersBase):
         return self.resolve_trace(self.tree.trace)
 
 
+class TruncatePolicy:
+    def __init__(self, max_depth: int = 50, truncate_depth: Optional[int] = None):
+        """fixed truncate policy of MyersRealTime, truncate once the search depth reaches max_depth,
+        subclass it and override observe/should_truncate for a custom policy
+
+        Args:
+            max_depth (int): max depth of trace
+            truncate_depth (int): min depth backtraced from end_node after trace exceeds max_depth,
+                                  if unspecified, defaults to max_depth // 3.
+        """
+        self.max_depth = max_depth
+        self.truncate_depth = truncate_depth if truncate_depth else max_depth // 3
+
+    def observe(self, elapsed: float, current_d: int, break_d: int) -> None:
+        """called after the search of every update
+
+        Args:
+            elapsed (float): seconds spent by the search
+            current_d (int): depth the next search will be resumed from
+            break_d (int): depth the search ended at
+        """
+
+    def should_truncate(self, current_d: int, break_d: int) -> bool:
+        """called before every update, truncate_depth is used if True is returned
+
+        Args:
+            current_d (int): depth the next search will be resumed from
+            break_d (int): depth the last search ended at
+
+        Returns:
+            bool: whether truncate the trace
+        """
+        return current_d >= self.max_depth
+
+
+class AdaptiveTruncatePolicy(TruncatePolicy):
+    def __init__(
+        self,
+        latency: float = 0.005,
+        max_depth: int = 50,
+        min_depth: int = 6,
+        upper_depth: int = 500,
+        ratio: int = 3,
+        smoothing: float = 0.3,
+    ):
+        """truncate policy adapting max_depth to the search cost of updates,
+        max_depth shrinks when the smoothed cost exceeds latency and grows when the cost is far below latency
+
+        Args:
+            latency (float, optional): target seconds spent by the search of an update. Defaults to 0.005.
+            max_depth (int, optional): initial max depth of trace. Defaults to 50.
+            min_depth (int, optional): lower bound of max_depth. Defaults to 6.
+            upper_depth (int, optional): upper bound of max_depth. Defaults to 500.
+            ratio (int, optional): truncate_depth is max_depth // ratio. Defaults to 3.
+            smoothing (float, optional): weight of the latest cost in the smoothed cost. Defaults to 0.3.
+        """
+        super().__init__(max_depth, max(max_depth // ratio, 1))
+        self.latency = latency
+        self.min_depth = min_depth
+        self.upper_depth = upper_depth
+        self.ratio = ratio
+        self.smoothing = smoothing
+        self.elapsed: Optional[float] = None  # smoothed search cost
+
+    def observe(self, elapsed: float, current_d: int, break_d: int) -> None:
+        if self.elapsed is None:
+            self.elapsed = elapsed
+        else:
+            self.elapsed = self.smoothing * elapsed + (1 - self.smoothing) * self.elapsed
+
+        if self.elapsed > self.latency:
+            # too slow, shrink fast, at least below the current frontier depth
+            self.max_depth = max(min(self.max_depth, break_d) * 2 // 3, self.min_depth)
+        elif self.elapsed < self.latency / 2 and current_d >= self.max_depth * 2 // 3:
+            # fast enough and the depth limit is being approached, grow slowly
+            self.max_depth = min(self.max_depth + max(self.max_depth // 10, 1), self.upper_depth)
+        self.truncate_depth = max(self.max_depth // self.ratio, 1)
+
+
 class MyersRealTime(MyersTree):
     def __init__(
         self,
@@ -335,6 +587,7 @@ class MyersRealTime(MyersTree):
         log_path: str = "",
         max_depth: int = 50,
         truncate_depth: Optional[int] = None,
+        policy: Optional[TruncatePolicy] = None,
     ):
         """myerse with realtime support
 
@@ -352,15 +605,38 @@ class MyersRealTime(MyersTree):
                                   the bigger truncate_depth the more coords will be reserved,
                                   truncate_depth should not be bigger than max_depth,
                                   if unspecified, defaults to truncate_depth // 3.
+            policy (Optional[TruncatePolicy]): policy deciding when and how far to truncate, e.g. AdaptiveTruncatePolicy.
+                                               Defaults to None, a fixed TruncatePolicy(max_depth, truncate_depth).
 
         """
         super().__init__(a, b, eq, plot, animation, plot_size, log_path)
         self.current_d = 0
         self.break_d = 0
         self.start_coord = Coord(0, 0)
+        self.settled_cost = 0  # deletes and inserts of truncated trace
 
-        self.max_depth = max_depth
-        self.truncate_depth = truncate_depth if truncate_depth else max_depth // 3
+        self.policy = policy if policy else TruncatePolicy(max_depth, truncate_depth)
+
+    @property
+    def max_depth(self) -> int:
+        return self.policy.max_depth
+
+    @max_depth.setter
+    def max_depth(self, value: int) -> None:
+        self.policy.max_depth = value
+
+    @property
+    def truncate_depth(self) -> int:
+        return self.policy.truncate_depth
+
+    @truncate_depth.setter
+    def truncate_depth(self, value: int) -> None:
+        self.policy.truncate_depth = value
+
+    @property
+    def cost(self) -> int:
+        """number of deletes and inserts on the trace to current end_node, truncated trace included"""
+        return self.settled_cost + self.tree.depth(self.tree.end_node)
 
     def update(self, b: Sequence) -> Diff:
         """add new b and get new diffs
@@ -375,19 +651,76 @@ class MyersRealTime(MyersTree):
         if not len(b):
             return self.resolve_trace([])
 
-        self.b = self.b + b  # type: ignore [operator]
+        self.b = self.extend(b)
         self.debug.update(b)
+        return self.resume()
+
+    def extend(self, b: Sequence) -> Sequence:
+        """current b followed by new b, override it to share b between instances instead of copying
+
+        Args:
+            b (Sequence): b to be appended to current b
+
+        Returns:
+            Sequence: new b
+        """
+        return self.b + b  # type: ignore [operator]
+
+    def revise(self, k: int, b: Optional[Sequence] = None) -> Diff:
+        """replace the trailing k elements of current b with new b and get new diffs,
+        the search is resumed from the latest snapshot that doesn't depend on the retracted elements
+
+        Args:
+            k (int): number of trailing elements of b to be retracted
+            b (Optional[Sequence]): b to be appended after retraction. Defaults to None, only retract.
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), corresponding to indexes of (a, b), indexes of a, indexes of b respectively
+        """
+        if not 0 <= k <= len(self.b):
+            raise ValueError("can not retract {} elements, only {} elements of b are not truncated".format(k, len(self.b)))
+        b = b if b is not None else self.b[:0]
+        m = len(self.b) - k
+        self.b = self.b[:m] + b  # type: ignore [operator]
+        self.current_d = self.tree.rollback(m)
+        self.debug.revise(k, b)
+        return self.resume()
+
+    def retract(self, k: int) -> Diff:
+        """retract the trailing k elements of current b and get new diffs
+
+        Args:
+            k (int): number of trailing elements of b to be retracted
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), corresponding to indexes of (a, b), indexes of a, indexes of b respectively
+        """
+        return self.revise(k)
+
+    @property
+    def latest_trace(self) -> List[Coord]:
+        """trace found by the latest search in coords of the whole a and b, starting from where it leaves the previous
+        trace, diffs reported before from that coord on are replaced by the latest diffs"""
+        trace = self.tree.latest_trace
+        if trace and trace[0] == self.tree.root.coord:
+            trace = trace[1:]  # virtual root, its edge is not an insert after truncation either
+        return [c + self.start_coord for c in trace]
+
+    def resume(self) -> Diff:
+        start = time.perf_counter()
         self.tree.checkout()
         self.realtime_shortest_edit()
         self.backtrace()
-        trace = [c + self.start_coord for c in self.tree.latest_trace]
-        return self.resolve_trace(trace)
+        self.policy.observe(time.perf_counter() - start, self.current_d, self.break_d)
+        return self.resolve_trace(self.latest_trace)
 
     def truncate(self):
-        if self.current_d >= self.max_depth:  # or self.break_d - self.current_d > 9:  # TODO: value?
+        if self.policy.should_truncate(self.current_d, self.break_d):
             self.current_d = 0
             self.break_d = 0
-            truncate_coord = self.tree.truncate(self.truncate_depth)
+            truncate_node = self.tree.truncate_node(self.truncate_depth)
+            truncate_coord = truncate_node.coord
+            self.settled_cost += self.tree.depth(truncate_node)
             self.a = self.a[truncate_coord.x :]
             self.b = self.b[truncate_coord.y :]
             self.start_coord += truncate_coord
@@ -426,11 +759,117 @@ class MyersRealTime(MyersTree):
                     self.debug.forward(node.p.coord, node.coord)
                 # saving status when node.y first reaches m
                 # its shortest edit end_node in current update, commit the leaves and save the depth, next update will start from here
-                if not self.tree.commited and node.y == m:
-                    self.tree.commit()
+                if not self.tree.commited and self.frontier_reached(node, n, m):
+                    self.tree.commit(m, d)
                     self.current_d = d
             # when farest_node.y exceeds m, end shortest edit search
-            if self.tree.farest_node.y >= m:
+            if self.search_ended(n, m):
                 self.tree.end_node = self.tree.farest_node
                 self.break_d = d
                 break
+
+    def frontier_reached(self, node: TreeNode, n: int, m: int) -> bool:
+        """whether node reaches the end of the known input, the frontier is committed at the first such node
+
+        Args:
+            node (TreeNode): node just extended
+            n (int): length of a
+            m (int): length of b
+
+        Returns:
+            bool: whether commit the frontier
+        """
+        return node.y == m
+
+    def search_ended(self, n: int, m: int) -> bool:
+        """whether the search of current update ends, checked after every d layer
+
+        Args:
+            n (int): length of a
+            m (int): length of b
+
+        Returns:
+            bool: whether end the search
+        """
+        return self.tree.farest_node.y >= m
+
+
+class MyersDuplex(MyersRealTime):
+    def __init__(
+        self,
+        a: Sequence,
+        b: Sequence,
+        eq: Optional[Callable[[Any, Any], bool]] = None,
+        plot: bool = False,
+        animation: bool = False,
+        plot_size: int = 50,
+        log_path: str = "",
+        max_depth: int = 50,
+        truncate_depth: Optional[int] = None,
+        policy: Optional[TruncatePolicy] = None,
+    ):
+        """myerse with realtime support on both sides, a and b can both grow incrementally
+
+        Args:
+            a (Sequence): a reference str/list/..., a can be empty.
+            b (Sequence): str/list/... that is expected to be compared with a, b can be empty.
+            eq (Optional[Callable[[Any, Any], bool]]): eq fn which should resolve a==b. Defaults to None.
+            plot (bool, optional): whether plot debug figure. Defaults to False.
+            animation (bool, optional): draw debug figure slowly or instantly. Defaults to True.
+            plot_size (int, optional): debug figure size. Defaults to 50.
+            log_path (str, optional): log_path to save a, b. Defaults to '', no data will be saved.
+            max_depth (int): max depth of trace
+            truncate_depth (int): min depth backtraced from end_node after trace exceeds max_depth,
+                                  see MyersRealTime.
+            policy (Optional[TruncatePolicy]): policy deciding when and how far to truncate, see MyersRealTime.
+        """
+        super().__init__(a, b, eq, plot, animation, plot_size, log_path, max_depth, truncate_depth, policy)
+
+    def update(self, b: Sequence, *, a: Optional[Sequence] = None) -> Diff:
+        """add new b and new a, get new diffs
+
+        Args:
+            b (Sequence): b to be appended to current b
+            a (Optional[Sequence]): a to be appended to current a. Defaults to None, a is unchanged.
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), corresponding to indexes of (a, b), indexes of a, indexes of b respectively
+        """
+        self.truncate()
+        a = a if a is not None else self.a[:0]
+        if not len(a) and not len(b):
+            return self.resolve_trace([])
+
+        self.a = self.a + a  # type: ignore [operator]
+        self.b = self.extend(b)
+        self.debug.update(b, a)
+        return self.resume()
+
+    def update_a(self, a: Sequence) -> Diff:
+        """add new a and get new diffs
+
+        Args:
+            a (Sequence): a to be appended to current a
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), corresponding to indexes of (a, b), indexes of a, indexes of b respectively
+        """
+        return self.update(self.b[:0], a=a)
+
+    def update_b(self, b: Sequence) -> Diff:
+        """add new b and get new diffs
+
+        Args:
+            b (Sequence): b to be appended to current b
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), corresponding to indexes of (a, b), indexes of a, indexes of b respectively
+        """
+        return self.update(b)
+
+    def frontier_reached(self, node: TreeNode, n: int, m: int) -> bool:
+        # nodes reached before the first node at the end of a or b don't depend on elements not arrived yet
+        return node.x >= n or node.y >= m
+
+    def search_ended(self, n: int, m: int) -> bool:
+        return self.tree.farest_node.x >= n or self.tree.farest_node.y >= m
@@ -0,0 +1,208 @@
+import bisect
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, Callable, Iterator, List, Optional, Sequence, Tuple,
+                    Type)
+
+from pymyers.debug import Coord
+from pymyers.myers import Diff, Matches, MyersBase
+
+# (start, end) of a diagonal run of matches between two segments
+Snake = Tuple[Coord, Coord]
+
+
+class MyersParallel(MyersBase):
+    def __init__(
+        self,
+        a: Sequence,
+        b: Sequence,
+        eq: Optional[Callable[[Any, Any], bool]] = None,
+        plot: bool = False,
+        animation: bool = False,
+        plot_size: int = 50,
+        log_path: str = "",
+        workers: Optional[int] = None,
+        min_size: int = 10000,
+        engine: Type[MyersBase] = MyersBase,
+        splits: str = "middle",
+    ):
+        """myerse splitting one diff into independent segments solved on a process pool.
+        With splits="middle", a and b are split recursively at middle snakes of Myers' linear space refinement,
+        which lie on an optimal path, so the stitched diff has as few edits as MyersBase, though it may pick another
+        optimal path. With splits="unique", a patience-style heuristic, elements occurring exactly once in both a and b
+        are used as split points without checking that they lie on an optimal path, which is cheaper but the stitched
+        diff may have more edits than MyersBase.
+        Falls back to a serial diff if eq is specified, if a and b are too small to split,
+        or for "unique" if elements are unhashable or no split point is found.
+
+        Args:
+            a (Sequence): a reference str/list/...
+            b (Sequence): str/list/... that is expected to be compared with a
+            eq (Optional[Callable[[Any, Any], bool]]): eq fn which should resolve a==b, disables splitting. Defaults to None.
+            plot (bool, optional): whether plot debug figure. Defaults to False.
+            animation (bool, optional): draw debug figure slowly or instantly. Defaults to True.
+            plot_size (int, optional): debug figure size. Defaults to 50.
+            log_path (str, optional): log_path to save a, b. Defaults to '', no data will be saved.
+            workers (Optional[int], optional): max processes of the pool. Defaults to None, number of cpus.
+            min_size (int, optional): min len(a) + len(b) of a segment. Defaults to 10000.
+            engine (Type[MyersBase], optional): myers class solving segments, e.g. MyersNumpy. Defaults to MyersBase.
+            splits (str, optional): "middle" for optimal middle snake splits, "unique" for patience-style splits.
+                                    Defaults to "middle".
+        """
+        if splits not in ("middle", "unique"):
+            raise ValueError('splits should be "middle" or "unique", got {!r}'.format(splits))
+        super().__init__(a, b, eq, plot, animation, plot_size, log_path)
+        self.parallel = eq is None
+        self.workers = workers
+        self.min_size = min_size
+        self.engine = engine
+        self.splits = splits
+
+    def anchors(self) -> Matches:
+        """longest chain of elements occurring exactly once in both a and b
+
+        Returns:
+            Matches: list of (a_coord, b_coord), increasing in both coords
+        """
+        count_a, count_b = Counter(self.a), Counter(self.b)
+        index_b = {e: j for j, e in enumerate(self.b) if count_b[e] == 1}
+        pairs = [(i, index_b[e]) for i, e in enumerate(self.a) if count_a[e] == 1 and e in index_b]
+
+        # longest increasing subsequence of b_coord by patience sorting
+        tails: List[int] = []  # smallest b_coord ending a chain of each length
+        tail_ids: List[int] = []
+        prev: List[int] = []
+        for p, (_, j) in enumerate(pairs):
+            length = bisect.bisect_left(tails, j)
+            if length == len(tails):
+                tails.append(j)
+                tail_ids.append(p)
+            else:
+                tails[length] = j
+                tail_ids[length] = p
+            prev.append(tail_ids[length - 1] if length else -1)
+
+        chain = []
+        p = tail_ids[-1] if tail_ids else -1
+        while p >= 0:
+            chain.append(Coord(*pairs[p]))
+            p = prev[p]
+        return chain[::-1]
+
+    def split_points(self) -> List[Snake]:
+        """snakes splitting a and b, segments between them are diffed independently
+
+        Returns:
+            List[Snake]: list of (start, end) of snakes, increasing in both coords,
+                         elements from start to end are matched, a snake of a middle split can be empty
+        """
+        return self._split_points(map)
+
+    def _split_points(self, map_fn: Callable[..., Iterator]) -> List[Snake]:
+        n, m = len(self.a), len(self.b)
+        if self.splits == "unique":
+            snakes: List[Snake] = []
+            last = Coord(0, 0)
+            for c in self.anchors():
+                if c.x - last.x + c.y - last.y >= self.min_size and n - c.x + m - c.y >= self.min_size:
+                    snakes.append((c, c + Coord(1, 1)))
+                    last = c + Coord(1, 1)
+            return snakes
+
+        # split segments at their middle snakes level by level, until they are smaller than 2 * min_size
+        snakes = []
+        pending = [(Coord(0, 0), Coord(n, m))] if n + m >= 2 * self.min_size else []
+        while pending:
+            segments = [(self.a[lo.x : hi.x], self.b[lo.y : hi.y]) for lo, hi in pending]
+            splitting = []
+            for (lo, hi), (d, start, end) in zip(pending, map_fn(_middle_snake, segments)):
+                if d < 2:  # one edit at most, nothing to split
+                    continue
+                snakes.append((start + lo, end + lo))
+                for seg_lo, seg_hi in ((lo, start + lo), (end + lo, hi)):
+                    if seg_hi.x - seg_lo.x + seg_hi.y - seg_lo.y >= 2 * self.min_size:
+                        splitting.append((seg_lo, seg_hi))
+            pending = splitting
+        return sorted(snakes, key=lambda snake: snake[0].x + snake[0].y)
+
+    def diff(self) -> Diff:
+        """calculate diff between a, b
+
+        Returns:
+            Diff: namedtuple('Diff', ['matches', 'deletes', 'inserts']), corresponding to indexes of (a, b), indexes of a, indexes of b respectively
+        """
+        if not self.parallel:
+            return super().diff()
+        if len(self.a) + len(self.b) < 2 * self.min_size:  # too small to split
+            return self.engine(self.a, self.b).diff()
+        with ProcessPoolExecutor(self.workers) as pool:
+            try:
+                splits = self._split_points(pool.map)
+            except TypeError:  # unhashable elements
+                splits = []
+            if not splits:
+                return self.engine(self.a, self.b).diff()
+
+            bounds = [Coord(0, 0)] + [end for _, end in splits]
+            ends = [start for start, _ in splits] + [Coord(len(self.a), len(self.b))]
+            segments = [(self.engine, self.a[lo.x : hi.x], self.b[lo.y : hi.y]) for lo, hi in zip(bounds, ends)]
+            diffs = list(pool.map(_diff_segment, segments))
+
+        # stitch segments with shifted indexes, snakes between them are matches
+        matches: Matches = []
+        deletes: List[int] = []
+        inserts: List[int] = []
+        for i, (lo, diff) in enumerate(zip(bounds, diffs)):
+            matches += [c + lo for c in diff.matches]
+            deletes += [x + lo.x for x in diff.deletes]
+            inserts += [y + lo.y for y in diff.inserts]
+            if i < len(splits):
+                start, end = splits[i]
+                matches += [start + Coord(j, j) for j in range(end.x - start.x)]
+        return Diff(matches, deletes, inserts)
+
+
+def _diff_segment(segment: Tuple[Type[MyersBase], Sequence, Sequence]) -> Diff:
+    engine, a, b = segment
+    if not len(a) and not len(b):
+        return Diff([], [], [])
+    return engine(a, b).diff()
+
+
+def _middle_snake(segment: Tuple[Sequence, Sequence]) -> Tuple[int, Coord, Coord]:  # type: ignore [return]
+    # middle snake of Myers' linear space refinement, searched forward from (0, 0) and backward from (n, m)
+    # until they overlap, it lies on an optimal path. Returns edit distance, start and end of the snake
+    a, b = segment
+    n, m = len(a), len(b)
+    delta = n - m
+    odd = delta % 2 != 0
+    maxd = (n + m + 1) // 2
+    forward = [0] * (maxd * 2 + 3)  # store x value indexed by k
+    backward = [0] * (maxd * 2 + 3)  # store x value counted from the end, indexed by k counted from the end
+    for d in range(maxd + 1):  # maxd included
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[k - 1] < forward[k + 1]):
+                x = forward[k + 1]
+            else:
+                x = forward[k - 1] + 1
+            y = x - k
+            start = Coord(x, y)
+            while x < n and y < m and a[x] == b[y]:
+                x, y = x + 1, y + 1
+            forward[k] = x
+            # overlap with backward paths of d - 1 edits, k counted from the end is delta - k
+            if odd and -(d - 1) <= delta - k <= d - 1 and x + backward[delta - k] >= n:
+                return 2 * d - 1, start, Coord(x, y)
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[k - 1] < backward[k + 1]):
+                x = backward[k + 1]
+            else:
+                x = backward[k - 1] + 1
+            y = x - k
+            end = Coord(n - x, m - y)
+            while x < n and y < m and a[n - 1 - x] == b[m - 1 - y]:
+                x, y = x + 1, y + 1
+            backward[k] = x
+            # overlap with forward paths of d edits
+            if not odd and -d <= delta - k <= d and x + forward[delta - k] >= n:
+                return 2 * d, Coord(n - x, m - y), end
@@ -0,0 +1,128 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pymyers.debug import Coord
+from pymyers.myers import MyersBase
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, MyersNumpy falls back to MyersBase
+    np = None  # type: ignore [assignment]
+
+
+class MyersNumpy(MyersBase):
+    def __init__(
+        self,
+        a: Sequence,
+        b: Sequence,
+        eq: Optional[Callable[[Any, Any], bool]] = None,
+        plot: bool = False,
+        animation: bool = False,
+        plot_size: int = 50,
+        log_path: str = "",
+        lockstep: int = 8,
+    ):
+        """myerse with numpy vectorized search, a and b are converted to integer arrays once,
+        every d layer is updated at once and snakes are extended by block comparisons,
+        the diff is the same as MyersBase. Falls back to MyersBase if numpy is not installed,
+        eq is specified, or a and b can't be converted.
+
+        Args:
+            a (Sequence): a reference str/bytes/list/numpy array/...
+            b (Sequence): str/bytes/list/numpy array/... that is expected to be compared with a
+            eq (Optional[Callable[[Any, Any], bool]]): eq fn which should resolve a==b, disables vectorization. Defaults to None.
+            plot (bool, optional): whether plot debug figure. Defaults to False.
+            animation (bool, optional): draw debug figure slowly or instantly. Defaults to True.
+            plot_size (int, optional): debug figure size. Defaults to 50.
+            log_path (str, optional): log_path to save a, b. Defaults to '', no data will be saved.
+            lockstep (int, optional): snake steps done for all diagonals of a layer together,
+                                      longer snakes are extended one by one with galloping block comparisons. Defaults to 8.
+        """
+        super().__init__(a, b, eq, plot, animation, plot_size, log_path)
+        self.vectorized = np is not None and eq is None
+        self.lockstep = lockstep
+
+    def shortest_edit(self) -> List[List[int]]:  # type: ignore [return]
+        arrays = self._as_arrays(self.a, self.b) if self.vectorized else None
+        if arrays is None:
+            return super().shortest_edit()
+
+        a, b = arrays
+        n, m = len(a), len(b)
+        maxd = self.max_edit(n, m)
+        v = np.zeros(maxd * 2 + 3, dtype=np.int64)  # store x value indexed by k, k in [-maxd - 1, maxd + 1]
+        trace = []
+        for d in range(maxd + 1):  # maxd included
+            # only v[-d - 1 : d + 2] is read by backtrace, negative k still indexes from the end
+            trace.append(np.concatenate((v[: d + 2], v[-d - 1 :])).tolist())
+            ks = np.arange(-d, d + 1, 2)
+            # moving downward or rightward, the same rule as MyersBase for all k of the layer
+            prev_down, prev_right = v[ks + 1], v[ks - 1]
+            down = (ks == -d) | ((ks != d) & (prev_right < prev_down))
+            x = np.where(down, prev_down, prev_right + 1)
+            start = x.copy()
+            # moving diagonally
+            x = self._snakes(a, b, x, ks)
+            v[ks] = x
+            if self.plot:
+                for k, moved_down, x0, x1 in zip(ks.tolist(), down.tolist(), start.tolist(), x.tolist()):
+                    prev = Coord(x0, x0 - k - 1) if moved_down else Coord(x0 - 1, x0 - k)
+                    self.debug.forward(prev, Coord(x0, x0 - k))
+                    self.debug.forward(Coord(x0, x0 - k), Coord(x1, x1 - k))
+            # end
+            if np.any((x >= n) & (x - ks >= m)):
+                return trace
+
+    def _snakes(self, a: "np.ndarray", b: "np.ndarray", x: "np.ndarray", ks: "np.ndarray") -> "np.ndarray":
+        n, m = len(a), len(b)
+        active = np.flatnonzero((x < n) & (x - ks < m))
+        # short snakes, step all diagonals together
+        for _ in range(self.lockstep):
+            if not active.size:
+                return x
+            xs = x[active]
+            active = active[a[xs] == b[xs - ks[active]]]
+            x[active] += 1
+            active = active[(x[active] < n) & (x[active] - ks[active] < m)]
+        # long snakes, gallop one by one
+        for i in active.tolist():
+            x[i] = self._gallop(a, b, int(x[i]), int(x[i] - ks[i]))
+        return x
+
+    @staticmethod
+    def _gallop(a: "np.ndarray", b: "np.ndarray", x: int, y: int) -> int:
+        n, m = len(a), len(b)
+        size = 16
+        while x < n and y < m:
+            step = min(size, n - x, m - y)
+            mismatches = np.flatnonzero(a[x : x + step] != b[y : y + step])
+            if mismatches.size:
+                return x + int(mismatches[0])
+            x, y, size = x + step, y + step, size * 2
+        return x
+
+    @staticmethod
+    def _as_arrays(a: Sequence, b: Sequence) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+        if isinstance(a, str) and isinstance(b, str):
+            return (
+                # surrogatepass keeps lone surrogates as their code points
+                np.frombuffer(a.encode("utf-32-le", "surrogatepass"), dtype=np.uint32),
+                np.frombuffer(b.encode("utf-32-le", "surrogatepass"), dtype=np.uint32),
+            )
+        if isinstance(a, (bytes, bytearray)) and isinstance(b, (bytes, bytearray)):
+            return np.frombuffer(a, dtype=np.uint8), np.frombuffer(b, dtype=np.uint8)
+        if not isinstance(a, str) and not isinstance(b, str):
+            try:
+                array_a, array_b = np.asarray(a), np.asarray(b)
+                if array_a.ndim == array_b.ndim == 1 and array_a.dtype.kind in "biuf" and array_b.dtype.kind in "biuf":
+                    return array_a, array_b
+            except ValueError:  # ragged elements, interned below
+                pass
+        # intern hashable elements to integer ids
+        table: Dict[Any, int] = {}
+        try:
+            return (
+                np.array([table.setdefault(e, len(table)) for e in a], dtype=np.int64),
+                np.array([table.setdefault(e, len(table)) for e in b], dtype=np.int64),
+            )
+        except TypeError:  # unhashable elements
+            return None
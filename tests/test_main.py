@@ -1,4 +1,7 @@
-from pymyers import Diff, MyersBase, MyersRealTime, MyersTree
+from pymyers import (AdaptiveTruncatePolicy, Diff, MyersBase, MyersBounded,
+                     MyersDuplex, MyersHierarchical, MyersIncremental,
+                     MyersMultiRealTime, MyersNumpy, MyersParallel,
+                     MyersRealTime, MyersTree, TruncatePolicy)
 
 
 def test_case1():
@@ -123,6 +126,234 @@ def test_case8():
         print(myers.update(bi))
 
 
+def test_case9():
+    a = "0123456789"
+
+    myers = MyersRealTime(a, "")
+    myers.update("01")
+    myers.update("2x")
+    diff = myers.revise(1, "345")
+    assert diff == Diff([(3, 3), (4, 4), (5, 5)], [], [])
+    diff = myers.retract(2)
+    assert diff == Diff([], [], [])
+    assert myers.b == "0123"
+    myers.update("4567")
+    diff = myers.resolve_trace(myers.tree.trace)
+    assert diff == Diff([(i, i) for i in range(8)], [], [])
+
+
+def test_case9_log(tmp_path):
+    from pymyers import Debug
+
+    a = "0123456789"
+    myers = MyersRealTime(a, "", log_path=str(tmp_path))
+    myers.update("01")
+    myers.update("2x")
+    myers.revise(1, "345")
+    myers.update("67")
+    myers.retract(3)
+    myers.update("5")
+
+    log_folder = next(tmp_path.iterdir())
+    a_re, *b = Debug.read(log_folder)
+    assert a_re == a
+    assert b == ["", "01", "2", "34", "", "", "5"]
+    assert "".join(b) == myers.b == "012345"
+
+
+def test_case10():
+    myers = MyersDuplex("", "")
+    assert myers.update("01", a="01") == Diff([(0, 0), (1, 1)], [], [])
+    assert myers.update_a("234") == Diff([], [], [])
+    assert myers.update_b("2x4") == Diff([(2, 2), (4, 4)], [3], [3])
+    assert myers.update("5", a="56") == Diff([(5, 5)], [], [])
+    assert myers.update_b("6") == Diff([(6, 6)], [], [])
+
+
+def test_case10_log(tmp_path):
+    from pymyers import Debug
+
+    myers = MyersDuplex("", "", log_path=str(tmp_path))
+    myers.update("01", a="01")
+    myers.update_a("234")
+    myers.update_b("2x4")
+    myers.revise(1, "4")
+    diff = myers.resolve_trace(myers.tree.trace)
+
+    log_folder = next(tmp_path.iterdir())
+    (a0, b0), *chunks = Debug.read_duplex(log_folder)
+    myers_re = MyersDuplex(a0, b0)
+    for a, b in chunks:
+        myers_re.update(b, a=a)
+    assert myers_re.a == myers.a == "01234"
+    assert myers_re.b == myers.b == "012x4"
+    assert myers_re.resolve_trace(myers_re.tree.trace) == diff
+
+
+def test_case11():
+    a = "ABCABBA"
+    b = "CBABAC"
+
+    myers = MyersIncremental(a, b)
+    myers.diff()
+    diff = myers.replace(1, 2, "XY", side="a")
+    assert myers.a == "AXYCABBA"
+    assert diff == Diff([], [0, 1, 2], [])  # window a[0:3] and b[0:0]
+    assert myers.last_diff == MyersBase(myers.a, b).diff()
+    myers.replace(5, 6, "", side="b")
+    assert myers.b == "CBABA"
+    assert myers.last_diff == MyersBase(myers.a, myers.b).diff()
+    myers.replace(0, 0, "AB", side="b", margin=2)
+    assert myers.b == "ABCBABA"
+    assert myers.last_diff == MyersBase(myers.a, myers.b).diff()
+
+    # previous diff given explicitly
+    myers = MyersIncremental(a, b)
+    myers.replace(1, 2, "XY", prev=MyersBase(a, b).diff())
+    assert myers.last_diff == MyersBase(myers.a, b).diff()
+
+
+def test_case12():
+    a = "0123456789" * 10
+    b = "0x23y56z89" * 10
+
+    policy = AdaptiveTruncatePolicy(latency=0, max_depth=30, min_depth=6)
+    myers = MyersRealTime(a, "", policy=policy)
+    for i in range(0, len(b), 5):
+        myers.update(b[i : i + 5])
+    assert myers.max_depth == 6
+    assert myers.truncate_depth == 2
+    assert myers.start_coord.y > 0
+
+    class EveryUpdate(TruncatePolicy):
+        def should_truncate(self, current_d, break_d):
+            return current_d > 0
+
+    myers = MyersRealTime(a, "", policy=EveryUpdate(truncate_depth=1))
+    for i in range(0, len(b), 5):
+        myers.update(b[i : i + 5])
+    assert myers.max_depth == 50
+    assert myers.start_coord.y > 0
+
+
+def test_case13():
+    a = "ABCABBA" * 20
+    b = "CBABAC" * 20
+    diff = MyersBase(a, b).diff()
+
+    assert MyersNumpy(a, b).diff() == diff
+    assert MyersNumpy(a.encode(), b.encode()).diff() == diff
+    assert MyersNumpy([ord(c) for c in a], [ord(c) for c in b]).diff() == diff
+    assert MyersNumpy(list(a), list(b), lockstep=0).diff() == diff
+    assert MyersNumpy(a, b, eq=lambda a, b: a == b).diff() == diff
+    assert MyersNumpy("a\ud800b", "ab").diff() == MyersBase("a\ud800b", "ab").diff()  # lone surrogate
+    assert MyersNumpy([[1], [2, 3]], [[2, 3]]).diff() == MyersBase([[1], [2, 3]], [[2, 3]]).diff()  # ragged
+
+
+def test_case14():
+    a = "ABCABBA0CBABAC1ABCABBA2CBABAC3ABCABBA"
+    b = "CBABAC0CBABAC1ABCABBA2CBAB3ABCAB"
+    diff = MyersBase(a, b).diff()
+    edits = len(diff.deletes) + len(diff.inserts)
+
+    # middle snakes are on an optimal path
+    myers = MyersParallel(a, b, workers=2, min_size=5)
+    diff_re = myers.diff()
+    assert len(myers.split_points()) > 1
+    assert len(diff_re.deletes) + len(diff_re.inserts) == edits
+    assert sorted([c.x for c in diff_re.matches] + diff_re.deletes) == list(range(len(a)))
+    assert sorted([c.y for c in diff_re.matches] + diff_re.inserts) == list(range(len(b)))
+    assert all(a[c.x] == b[c.y] for c in diff_re.matches)
+    assert MyersParallel(a, b, min_size=5, engine=MyersNumpy).diff() == diff_re
+    assert MyersParallel(a, b, eq=lambda a, b: a == b, min_size=5).diff() == diff
+
+    myers = MyersParallel(a, b, workers=2, min_size=5, splits="unique")
+    assert myers.split_points() == [((7, 6), (8, 7)), ((14, 13), (15, 14)), ((22, 21), (23, 22)), ((29, 26), (30, 27))]
+    assert myers.diff() == diff
+
+    # split point "1" is on no optimal path, only the unique heuristic costs more edits
+    a = "ABAB1ABAB"
+    b = "ABABABAB1"
+    diff = MyersBase(a, b).diff()
+    diff_re = MyersParallel(a, b, min_size=1, splits="unique").diff()
+    assert len(diff_re.deletes) + len(diff_re.inserts) > len(diff.deletes) + len(diff.inserts)
+    diff_re = MyersParallel(a, b, min_size=1).diff()
+    assert len(diff_re.deletes) + len(diff_re.inserts) == len(diff.deletes) + len(diff.inserts)
+
+
+def test_case15():
+    a = ["ABCABBA", "same", "0123456789", "ABCABBA"]
+    b = ["CBABAC", "same", "abcdefghij", "new", "CBABAC"]
+
+    myers = MyersHierarchical(a, b, max_d=10)
+    diff = myers.diff()
+    assert diff.lines == Diff([(1, 1)], [0, 2, 3], [0, 2, 3, 4])
+    assert diff.pairs == [(0, 0), (2, 2), (3, 3)]
+    assert diff.tokens[0] == MyersBase("ABCABBA", "CBABAC").diff()
+    assert diff.tokens[1] is None  # 20 edits exceed max_d
+    assert diff.tokens[2] == MyersBase("ABCABBA", "new").diff()
+    assert len(myers.cache) == 3
+
+    # identical pairs are served from cache
+    cache = myers.cache
+    myers = MyersHierarchical(["ABCABBA", "x"], ["CBABAC", "x"], max_d=10, cache=cache)
+    assert myers.diff().tokens[0] is diff.tokens[0]
+
+    # a shared cache is not stale for another max_d
+    myers = MyersHierarchical(["0123456789"], ["abcdefghij"], max_d=20, cache=cache)
+    assert myers.diff().tokens[0] == MyersBase("0123456789", "abcdefghij").diff()
+    assert len(cache) == 4
+
+    # token lists are memoized as tuples
+    myers = MyersHierarchical([list("ABCABBA")], [list("CBABAC")], max_d=10, cache=cache)
+    assert myers.diff().tokens[0] == diff.tokens[0]
+    assert (tuple("ABCABBA"), tuple("CBABAC"), 10, None) in cache
+    assert MyersHierarchical([list("ABCABBA")], [list("CBABAC")], max_d=10, cache=cache).diff().tokens[0] is cache[
+        (tuple("ABCABBA"), tuple("CBABAC"), 10, None)
+    ]
+
+    assert MyersBounded("ABCABBA", "CBABAC", max_d=4).diff() is None
+    assert MyersBounded("ABCABBA", "CBABAC", max_d=5).diff() == MyersBase("ABCABBA", "CBABAC").diff()
+    assert MyersBounded("", "", max_d=0).diff() == Diff([], [], [])
+    assert MyersBase("", "").diff() == Diff([], [], [])
+
+
+def test_case16():
+    references = {
+        "v1": "the quick brown fox jumps over the lazy dog",
+        "v2": "the quick red fox jumps over the lazy cat",
+        "v3": "lorem ipsum dolor sit amet",
+    }
+    b = "the quick red fox jumps over"
+
+    myers = MyersMultiRealTime(references, "", beam=3)
+    for i in range(0, len(b), 4):
+        best, diff = myers.update(b[i : i + 4])
+    assert best == "v2"
+    assert myers.pruned == ["v3", "v1"]
+    assert myers.costs == {"v2": 0}
+
+    assert diff == Diff([(i, i) for i in range(len(b))], [], [])  # whole diff so far
+
+    # the whole diff of the new best is reported when the best reference changes
+    references = {"v1": "abcdeXXXXXXX", "v2": "abQdeYYYYYYY"}
+    myers = MyersMultiRealTime(references, "", beam=None)
+    assert myers.update("abcde") == ("v1", MyersBase("abcde", "abcde").diff())
+    assert myers.update("YYYYYYY") == ("v2", MyersBase(references["v2"], "abcdeYYYYYYY").diff())
+    assert myers.costs == {"v1": 7, "v2": 2}
+
+    # candidates share one b, truncated elements are dropped from it
+    a = "0123456789" * 20
+    b = a.replace("5", "x")
+    myers = MyersMultiRealTime([a, a[::-1]], "", beam=None, max_depth=4, truncate_depth=1)
+    for i in range(0, len(b), 5):
+        myers.update(b[i : i + 5])
+    assert all(candidate.b.buffer is myers.buffer for candidate in myers.candidates.values())
+    assert myers.buffer.offset > 0 and len(myers.buffer) == len(b)
+    assert myers.costs[0] == 40  # a delete and an insert for each x
+    assert myers.diffs[0].deletes == myers.diffs[0].inserts == [i for i, c in enumerate(b) if c == "x"]
+
+
 if __name__ == "__main__":
     a = "56789asdfghjkl"
     b = ""